@@ -16,9 +16,26 @@ import os
 import re
 import csv
 import json
+import time
+import itertools
+import threading
+import http.client
+from urllib.parse import urlsplit
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
 from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# 缓存读写优先使用orjson（可选，pip install orjson），未安装时使用标准库json
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
 
 
 # ==================== 配置 ====================
@@ -37,10 +54,92 @@ CACHE_FILE = SCRIPT_DIR / "translation_cache.json"
 # API密钥文件
 API_KEY_FILE = SCRIPT_DIR / "ds_api.txt"
 
+# 并行提取的最大进程数
+MAX_WORKERS = min(os.cpu_count() or 1, 8)
+# 文件数少于此值时直接串行提取，不值得启动进程池
+PARALLEL_MIN_FILES = 64
+
+# 批量翻译：每次请求的条数、并发请求数、失败重试次数
+API_BATCH_SIZE = 20
+API_WORKERS = 4
+API_MAX_RETRIES = 3
+
+# API连续失败达到该次数后，本次运行不再调用API（如密钥无效、服务不可用）
+API_MAX_FAILURES = 3
+
+
+# ==================== 正则 ====================
+# 字符串字面量：dollar/dollar2为$前缀（插值字符串，$@"" 或 @$""），text为字符串内容
+# 逐字字符串 @"..." 不处理反斜杠转义，"" 表示引号；普通字符串支持 \ 转义
+_STRING_RE = re.compile(
+    r'(?P<dollar>\$)?(?P<at>@)?(?P<dollar2>\$)?'
+    r'"(?P<text>(?(at)(?:[^"]|"")*|(?:[^"\\]|\\.)*))"')
+
+# 行尾注释：group(1)为字符串/字符字面量（原样保留），否则匹配 // 到行尾
+_COMMENT_RE = re.compile(
+    r'(@\$?"(?:[^"]|"")*"|"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')|//.*$')
+
+# 块注释 /* */：group(1)为字符串/字符字面量或行注释（原样保留，避免其中的 /* 被误判）
+_BLOCK_COMMENT_RE = re.compile(
+    r'(@\$?"(?:[^"]|"")*"|"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\'|//[^\n]*)|/\*.*?\*/', re.S)
+
+# 纯Attribute行，如 [Header("...")]
+_ATTR_RE = re.compile(r'^\s*\[[^\]]*\]\s*$')
+
+# 中文字符
+_CJK_RE = re.compile('[\u4e00-\u9fff]')
+
+# 格式化后的参数占位符 {0}, {1}...
+_PARAM_RE = re.compile(r'\{[\d]+\}')
+
+# 原始参数占位符 {xxx}
+_PARAMX_RE = re.compile(r'\{[^}]+\}')
+
+# 文件预筛：任意非ASCII字节（中文，也包括GBK/UTF-16等需要解码报错的文件），
+# 或插值字符串 $"（纯参数的插值字符串也需要提取）
+_NON_ASCII_BYTE_RE = re.compile(rb'[\x80-\xff]|\$"')
+
+# 非中文字符
+_NON_CJK_RE = re.compile('[^\u4e00-\u9fff]+')
+
+
+def _blank_block_comment(match: re.Match) -> str:
+    """块注释替换为等量换行，其余匹配原样返回"""
+    if match.group(1) is not None:
+        return match.group(1)
+    return '\n' * match.group().count('\n')
+
+
+def _build_key_table(word_map: Dict[str, str], keep_unknown: bool) -> Dict[int, Optional[str]]:
+    """构建str.translate映射表：中文字符 -> "_" + 英文单词"""
+    if keep_unknown:
+        table = {code: '_' + chr(code) for code in range(0x4e00, 0xa000)}
+    else:
+        table = dict.fromkeys(range(0x4e00, 0xa000))
+    for char, word in word_map.items():
+        if len(char) == 1:
+            table[ord(char)] = '_' + word
+    return table
+
+
+def _keyify(text: str, table: Dict[int, Optional[str]]) -> str:
+    """中文转key片段：去掉非中文字符后整串查表，如 抽卡 -> DRAW_CARD"""
+    return _NON_CJK_RE.sub('', text).translate(table).lstrip('_')
+
+
+def _prefix_key(result: str, context: str) -> str:
+    """加上模块名前缀，并限制长度（减去模块名和下划线的长度）"""
+    module_name = context.upper() if context else ""
+    max_len = 50 - len(module_name) - 1
+    if max_len > 0:
+        result = result[:max_len]
+    return f"{module_name}_{result}" if module_name else result
+
 
 @dataclass
 class ChineseString:
     """中文字符串信息"""
+    __slots__ = ('value', 'pos')
     value: str  # 格式化后的中文文本（参数已替换为{0},{1}等）
     pos: str    # 位置信息 (文件名---行数)
 
@@ -48,6 +147,8 @@ class ChineseString:
 class TranslationCache:
     """翻译缓存"""
     
+    __slots__ = ('cache',)
+    
     def __init__(self):
         self.cache: Dict[str, str] = {}
         self._load_cache()
@@ -55,14 +156,17 @@ class TranslationCache:
     def _load_cache(self):
         if CACHE_FILE.exists():
             try:
-                with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-                    self.cache = json.load(f)
+                with open(CACHE_FILE, 'rb') as f:
+                    self.cache = _json_loads(f.read())
             except:
                 self.cache = {}
     
     def save(self):
-        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self.cache, f, ensure_ascii=False, indent=2)
+        # 先写临时文件再替换，中途中断也不会损坏已有缓存
+        tmp_file = CACHE_FILE.with_suffix('.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(_json_dumps(self.cache))
+        os.replace(tmp_file, CACHE_FILE)
     
     def get(self, key: str) -> Optional[str]:
         return self.cache.get(key)
@@ -74,10 +178,70 @@ class TranslationCache:
 class DeepSeekTranslator:
     """DeepSeek API翻译器"""
     
+    __slots__ = ('api_key', 'cache', 'api_url', '_local', '_fail_count', '_disabled')
+    
+    # 常用词汇映射（扩展版）
+    WORD_MAP = {
+        # 抽卡相关
+        '抽': 'DRAW', '卡': 'CARD', '道': 'ITEM', '具': 'PROP',
+        '足': 'SUFFICIENT', '不': 'NOT', '再': 'RE', '结': 'OATH',
+        '义': 'BIND', '次': 'TIME', '必': 'MUST', '得': 'GET',
+        '红': 'RED', '将': 'GENERAL', '累': 'TOTAL', '计': 'COUNT',
+        '总': 'TOTAL', '资': 'RESOURCE', '源': 'SOURCE',
+        
+        # 通用UI
+        '确': 'CONFIRM', '认': 'CONFIRM', '购': 'PURCHASE',
+        '买': 'BUY', '这': 'THIS', '个': 'GE', '吗': 'QUESTION',
+        '请': 'PLEASE', '拖': 'DRAG', '拽': 'DROP', '指': 'SPECIFY',
+        '定': 'FIXED', '位': 'POSITION', '物': 'ITEM',
+        '品': 'PRODUCT', '数': 'NUMBER', '量': 'AMOUNT',
+        '无': 'NO', '法': 'WAY', '完': 'COMPLETE', '成': 'COMPLETE',
+        
+        # 探索/关卡相关
+        '探': 'EXPLORE', '索': 'SEARCH', '度': 'DEGREE',
+        '推': 'RECOMMEND', '荐': 'RECOMMEND', '战': 'BATTLE',
+        '力': 'POWER', '等': 'LEVEL', '阵': 'LINEUP',
+        '容': 'CONTAINER', '为': 'IS', '空': 'EMPTY',
+        '无': 'CANNOT', '法': 'ABLE', '跳': 'JUMP', '过': 'PASS',
+        '主': 'MAIN', '线': 'LINE', '关': 'LEVEL', '尚': 'NOT',
+        '未': 'UN', '解': 'UNLOCK', '锁': 'LOCK',
+        
+        # 路径/地图相关
+        '路': 'PATH', '径': 'WAY', '点': 'POINT',
+        '错': 'ERROR', '误': 'ERROR', '需': 'NEED',
+        '地': 'MAP', '图': 'MAP', '资': 'ASSET',
+        '产': 'ASSET', '态': 'STATE', '信': 'INFO',
+        '息': 'TION', '显': 'SHOW', '示': 'SHOW',
+        
+        # 奖励/任务
+        '奖': 'REWARD', '励': 'INCENTIVE', '务': 'TASK',
+        '完': 'COMPLETE', '败': 'FAIL', '功': 'SUCCESS',
+        
+        # 操作相关
+        '返': 'BACK', '回': 'RETURN', '关': 'CLOSE',
+        '闭': 'CLOSE', '打': 'OPEN', '开': 'OPEN',
+        '设': 'SET', '置': 'TING', '选': 'OPTION',
+        '项': 'ITEM', '提': 'TIP', '警': 'WARNING',
+        '告': 'ALERT', '可': 'CAN', '以': 'ABLE',
+        '任': 'APPOINT', '命': 'NAME', '州': 'STATE',
+        '牧': 'GOVERNOR', '获': 'GET', '得': 'OBTAIN',
+        '额': 'EXTRA', '外': 'EXTRA', '占': 'OCCUPY',
+        '领': 'LEAD', '产': 'OUTPUT', '出': 'OUTPUT',
+        '加': 'BONUS', '成': 'cheng',
+    }
+    
+    # 中文 -> "_WORD"，未收录的中文字符直接丢弃
+    _KEY_TABLE = _build_key_table(WORD_MAP, keep_unknown=False)
+    
     def __init__(self, api_key: str, cache: TranslationCache):
         self.api_key = api_key
         self.cache = cache
         self.api_url = "https://api.deepseek.com/v1/chat/completions"
+        # 每个线程一个HTTPS长连接，复用TCP/TLS
+        self._local = threading.local()
+        # 连续失败计数，超限后熔断
+        self._fail_count = 0
+        self._disabled = False
     
     def translate(self, chinese_text: str, context: str = "") -> str:
         """将中文翻译成英文变量名"""
@@ -89,25 +253,144 @@ class DeepSeekTranslator:
         # 本地翻译优先（避免API调用问题）
         result = self._local_translate(chinese_text, context)
         
-        # 尝试API翻译
-        try:
-            api_result = self._call_api(chinese_text, context)
-            if api_result and api_result != result:
-                result = api_result
+        # 尝试API翻译（已熔断则直接使用本地翻译）
+        if not self._disabled:
+            try:
+                api_result = self._call_api(chinese_text, context)
+                self._record_api_result(True)
+                if api_result:
+                    result = api_result
                 self.cache.set(cache_key, result)
                 return result
-        except Exception as e:
-            print(f"  翻译API调用失败: {e}")
+            except Exception as e:
+                print(f"  翻译API调用失败: {e}")
+                self._record_api_result(False)
         
-        self.cache.set(cache_key, result)
+        # API失败或已熔断：本地翻译只用于本次运行，不写入缓存，下次运行仍会请求API
         return result
     
+    def translate_batch(self, items: List[Tuple[str, str]]) -> List[str]:
+        """批量翻译 [(中文, 上下文), ...]，结果顺序与输入一致
+        
+        未命中缓存的条目按上下文分组，每API_BATCH_SIZE条合并为一次请求，
+        多个请求并发发出；请求失败的条目使用本地翻译
+        """
+        results = [self.cache.get(f"{context}:{text}") for text, context in items]
+        
+        # 按上下文分组并切块
+        pending: Dict[str, List[int]] = {}
+        for i, (text, context) in enumerate(items):
+            if not results[i]:
+                pending.setdefault(context, []).append(i)
+        
+        chunks = []
+        for indexes in pending.values():
+            for start in range(0, len(indexes), API_BATCH_SIZE):
+                chunks.append(indexes[start:start + API_BATCH_SIZE])
+        
+        if not chunks:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=API_WORKERS) as executor:
+            api_results = executor.map(
+                lambda chunk: self._call_api_batch([items[i] for i in chunk]), chunks)
+            
+            for chunk, translations in zip(chunks, api_results):
+                for n, i in enumerate(chunk):
+                    text, context = items[i]
+                    if translations is None:
+                        # API失败或已熔断：本地翻译只用于本次运行，不写入缓存，下次运行仍会请求API
+                        results[i] = self._local_translate(text, context)
+                        continue
+                    result = translations[n] or self._local_translate(text, context)
+                    self.cache.set(f"{context}:{text}", result)
+                    results[i] = result
+        
+        return results
+    
+    def _call_api_batch(self, items: List[Tuple[str, str]]) -> Optional[List[str]]:
+        """一次请求翻译多条中文（同一上下文），失败时按指数退避重试"""
+        context = items[0][1]
+        numbered = "\n".join(f"{n}. {text}" for n, (text, _) in enumerate(items, 1))
+        
+        prompt = f"""将以下中文逐条翻译成C#常量命名风格（全部大写，下划线分隔）：
+
+上下文: {context}
+
+{numbered}
+
+只返回一个JSON字符串数组，顺序和数量与上面一致，不要其他内容。
+示例：["DRAW_CARD_ITEM_INSUFFICIENT"]"""
+
+        data = {
+            "model": "deepseek-chat",
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": 50 * len(items),
+            "temperature": 0.3
+        }
+        
+        for attempt in range(API_MAX_RETRIES):
+            if self._disabled:
+                return None
+            try:
+                content = self._post(data)
+            except Exception as e:
+                print(f"  批量翻译失败（第{attempt + 1}次）: {e}")
+                self._record_api_result(False)
+            else:
+                self._record_api_result(True)
+                try:
+                    # 兼容 ```json ... ``` 包裹的返回
+                    translations = json.loads(content[content.index('['):content.rindex(']') + 1])
+                    if len(translations) == len(items):
+                        return [str(t).strip() for t in translations]
+                except (AttributeError, TypeError, ValueError) as e:
+                    print(f"  批量翻译结果解析失败（第{attempt + 1}次）: {e}")
+            if attempt + 1 < API_MAX_RETRIES:
+                time.sleep(2 ** attempt)
+        
+        return None
+    
+    def _record_api_result(self, success: bool):
+        """记录API调用结果，连续失败达到API_MAX_FAILURES次后停用API"""
+        if success:
+            self._fail_count = 0
+            return
+        self._fail_count += 1
+        if self._fail_count >= API_MAX_FAILURES and not self._disabled:
+            self._disabled = True
+            print(f"  API连续失败{self._fail_count}次，本次运行改用本地翻译")
+    
+    def _post(self, data: dict) -> Optional[str]:
+        """发送请求并返回回复内容，连接在同一线程内复用"""
+        conn = getattr(self._local, 'conn', None)
+        url = urlsplit(self.api_url)
+        if conn is None:
+            conn = self._local.conn = http.client.HTTPSConnection(url.netloc, timeout=30)
+        
+        try:
+            conn.request('POST', url.path, body=json.dumps(data).encode('utf-8'), headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            })
+            response = conn.getresponse()
+            body = response.read()
+        except Exception:
+            # 连接已损坏，下次重建
+            conn.close()
+            self._local.conn = None
+            raise
+        
+        if response.status != 200:
+            raise RuntimeError(f"HTTP {response.status}")
+        
+        result = json.loads(body.decode('utf-8'))
+        if result.get("choices"):
+            return result["choices"][0]["message"]["content"].strip()
+        return None
+    
     def _call_api(self, chinese_text: str, context: str) -> Optional[str]:
         """调用DeepSeek API"""
-        import urllib.request
-        import urllib.error
-        import json
-        
         prompt = f"""将以下中文翻译成C#常量命名风格（全部大写，下划线分隔）：
 
 中文: {chinese_text}
@@ -123,120 +406,40 @@ class DeepSeekTranslator:
             "temperature": 0.3
         }
         
-        try:
-            req = urllib.request.Request(
-                self.api_url,
-                data=json.dumps(data).encode('utf-8'),
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                }
-            )
-            with urllib.request.urlopen(req, timeout=30) as response:
-                result = json.loads(response.read().decode('utf-8'))
-                if result.get("choices"):
-                    return result["choices"][0]["message"]["content"].strip()
-        except Exception:
-            pass
-        
-        return None
+        return self._post(data)
     
     def _local_translate(self, chinese_text: str, context: str) -> str:
         """本地翻译"""
         # 清理参数占位符
-        text = re.sub(r'\{[\d]+\}', '', chinese_text).strip()
+        text = _PARAM_RE.sub('', chinese_text).strip()
         
         if not text:
             # 只有参数的情况，使用上下文+参数数量生成key
-            param_count = len(re.findall(r'\{[\d]+\}', chinese_text))
+            param_count = len(_PARAM_RE.findall(chinese_text))
             if context:
                 return f"{context.upper()}_PARAM_{param_count}"
             return f"PARAM_{param_count}"
         
-        # 常用词汇映射（扩展版）
-        word_map = {
-            # 抽卡相关
-            '抽': 'DRAW', '卡': 'CARD', '道': 'ITEM', '具': 'PROP',
-            '足': 'SUFFICIENT', '不': 'NOT', '再': 'RE', '结': 'OATH',
-            '义': 'BIND', '次': 'TIME', '必': 'MUST', '得': 'GET',
-            '红': 'RED', '将': 'GENERAL', '累': 'TOTAL', '计': 'COUNT',
-            '总': 'TOTAL', '资': 'RESOURCE', '源': 'SOURCE',
-            
-            # 通用UI
-            '确': 'CONFIRM', '认': 'CONFIRM', '购': 'PURCHASE',
-            '买': 'BUY', '这': 'THIS', '个': 'GE', '吗': 'QUESTION',
-            '请': 'PLEASE', '拖': 'DRAG', '拽': 'DROP', '指': 'SPECIFY',
-            '定': 'FIXED', '位': 'POSITION', '物': 'ITEM',
-            '品': 'PRODUCT', '数': 'NUMBER', '量': 'AMOUNT',
-            '无': 'NO', '法': 'WAY', '完': 'COMPLETE', '成': 'COMPLETE',
-            
-            # 探索/关卡相关
-            '探': 'EXPLORE', '索': 'SEARCH', '度': 'DEGREE',
-            '推': 'RECOMMEND', '荐': 'RECOMMEND', '战': 'BATTLE',
-            '力': 'POWER', '等': 'LEVEL', '阵': 'LINEUP',
-            '容': 'CONTAINER', '为': 'IS', '空': 'EMPTY',
-            '无': 'CANNOT', '法': 'ABLE', '跳': 'JUMP', '过': 'PASS',
-            '主': 'MAIN', '线': 'LINE', '关': 'LEVEL', '尚': 'NOT',
-            '未': 'UN', '解': 'UNLOCK', '锁': 'LOCK',
-            
-            # 路径/地图相关
-            '路': 'PATH', '径': 'WAY', '点': 'POINT',
-            '错': 'ERROR', '误': 'ERROR', '需': 'NEED',
-            '地': 'MAP', '图': 'MAP', '资': 'ASSET',
-            '产': 'ASSET', '态': 'STATE', '信': 'INFO',
-            '息': 'TION', '显': 'SHOW', '示': 'SHOW',
-            
-            # 奖励/任务
-            '奖': 'REWARD', '励': 'INCENTIVE', '务': 'TASK',
-            '完': 'COMPLETE', '败': 'FAIL', '功': 'SUCCESS',
-            
-            # 操作相关
-            '返': 'BACK', '回': 'RETURN', '关': 'CLOSE',
-            '闭': 'CLOSE', '打': 'OPEN', '开': 'OPEN',
-            '设': 'SET', '置': 'TING', '选': 'OPTION',
-            '项': 'ITEM', '提': 'TIP', '警': 'WARNING',
-            '告': 'ALERT', '可': 'CAN', '以': 'ABLE',
-            '任': 'APPOINT', '命': 'NAME', '州': 'STATE',
-            '牧': 'GOVERNOR', '获': 'GET', '得': 'OBTAIN',
-            '额': 'EXTRA', '外': 'EXTRA', '占': 'OCCUPY',
-            '领': 'LEAD', '产': 'OUTPUT', '出': 'OUTPUT',
-            '加': 'BONUS', '成': 'cheng',
-        }
-        
-        # 翻译每个字符
-        result_words = []
-        for char in text:
-            if '\u4e00' <= char <= '\u9fff':
-                translated = word_map.get(char, char)
-                # 如果翻译结果还是中文字符，跳过
-                if '\u4e00' <= translated <= '\u9fff':
-                    continue
-                result_words.append(translated)
+        result = _keyify(text, self._KEY_TABLE)
         
-        if not result_words:
+        if not result:
             # 没有可翻译的字符，使用上下文+描述
-            param_count = len(re.findall(r'\{[\d]+\}', chinese_text))
+            param_count = len(_PARAM_RE.findall(chinese_text))
             if param_count > 0:
                 return f"{context.upper()}_PARAM_{param_count}"
             return f"{context.upper()}_TEXT"
         
         # 生成key，确保以模块名开头
-        module_name = context.upper() if context else ""
-        result = "_".join(result_words)
-        
-        # 限制长度（减去模块名和下划线的长度）
-        max_len = 50 - len(module_name) - 1
-        if max_len > 0:
-            result = result[:max_len]
-        
-        return f"{module_name}_{result}" if module_name else result
+        return _prefix_key(result, context)
 
 
 class ChineseExtractor:
     """中文字符串提取器"""
     
+    __slots__ = ()
+    
     # 需要忽略的文件夹
-    IGNORE_FOLDERS = {'bind', 'Bind', 'BIND', '.git', '.svn', 'node_modules'}
+    IGNORE_FOLDERS = frozenset({'bind', 'Bind', 'BIND', '.git', '.svn', 'node_modules'})
     
     # 需要忽略的API
     IGNORE_API_PATTERNS = [
@@ -257,36 +460,41 @@ class ChineseExtractor:
         re.compile(r'ExceptionHelper\.'),
     ]
     
+    # 合并为单个正则，每行只需匹配一次
+    IGNORE_API_RE = re.compile('|'.join(f'(?:{p.pattern})' for p in IGNORE_API_PATTERNS))
+    
     # 代码文件扩展名
-    CODE_EXTENSIONS = {'.cs'}
+    CODE_EXTENSIONS = frozenset({'.cs'})
     
-    def extract_from_file(self, file_path: Path) -> List[ChineseString]:
+    def extract_from_file(self, file_path: str) -> List[ChineseString]:
         """从文件中提取中文字符串"""
         results = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            # 纯ASCII且无插值字符串的文件直接跳过，省去解码和逐行扫描
+            if not _NON_ASCII_BYTE_RE.search(data):
+                return results
+            content = data.decode('utf-8')
+            del data
         except Exception as e:
             print(f"  读取失败: {e}")
             return results
         
-        lines = content.split('\n')
-        in_multiline_comment = False
+        # 整体去掉块注释 /* */，保留其中的换行以维持行号
+        if '/*' in content:
+            content = _BLOCK_COMMENT_RE.sub(_blank_block_comment, content)
+        
+        # splitlines统一处理CRLF/LF（二进制读取不做换行转换）
+        lines = content.splitlines()
+        del content
+        
+        # 文件内去重，同一字符串只保留第一次出现的位置
+        seen = set()
+        file_name = os.path.basename(file_path)
         
         for i, line in enumerate(lines, 1):
-            original_line = line
-            
-            # 检查多行注释
-            if '/*' in line:
-                in_multiline_comment = True
-            if '*/' in line:
-                in_multiline_comment = False
-                continue
-            
-            if in_multiline_comment:
-                continue
-            
             # 检查Attribute
             if self._is_attribute_line(line):
                 continue
@@ -295,16 +503,18 @@ class ChineseExtractor:
             line = self._remove_comment(line)
             
             # 忽略Debug API
-            for pattern in self.IGNORE_API_PATTERNS:
-                if pattern.search(original_line):
-                    continue
+            if self.IGNORE_API_RE.search(line):
+                continue
             
             # 查找字符串
-            chinese_strings = self._find_chinese_strings(original_line)
+            chinese_strings = self._find_chinese_strings(line)
             
             for text in chinese_strings:
                 formatted = self._format_string(text)
-                pos = f"{file_path.name}---{i}"
+                if formatted in seen:
+                    continue
+                seen.add(formatted)
+                pos = f"{file_name}---{i}"
                 
                 results.append(ChineseString(
                     value=formatted,
@@ -315,96 +525,122 @@ class ChineseExtractor:
     
     def _is_attribute_line(self, line: str) -> bool:
         """检查是否是纯Attribute行"""
-        stripped = line.strip()
-        if stripped.startswith('[') and ']' in stripped:
-            bracket_end = stripped.find(']')
-            after_bracket = stripped[bracket_end + 1:].strip()
-            if not after_bracket:
-                return True
-        return False
+        return _ATTR_RE.match(line) is not None
     
     def _remove_comment(self, line: str) -> str:
-        """移除行尾注释"""
-        result = []
-        in_string = False
-        string_char = None
-        
-        for char in line:
-            if not in_string and (char == '"' or char == "'"):
-                in_string = True
-                string_char = char
-                result.append(char)
-            elif in_string and char == string_char:
-                if result and result[-1] == '\\':
-                    result[-1] = char
-                else:
-                    in_string = False
-                    string_char = None
-                    result.append(char)
-            elif not in_string and char == '/' and result and result[-1] == '/':
-                break
-            else:
-                result.append(char)
-        
-        return ''.join(result)
+        """移除行尾注释（保留字符串中的//）"""
+        if '//' not in line:
+            return line
+        return _COMMENT_RE.sub(lambda m: m.group(1) or '', line)
     
     def _find_chinese_strings(self, line: str) -> List[str]:
-        """查找中文字符串"""
-        # 首先检查是否包含忽略的API
-        for pattern in self.IGNORE_API_PATTERNS:
-            if pattern.search(line):
-                return []
-        
+        """查找中文字符串（忽略API的行已在extract_from_file中跳过）"""
         results = []
         
-        # 插值字符串 $"" 
-        for match in re.findall(r'\$\"([^\"]*)\"', line):
-            if self._has_chinese(match) or self._has_params(match):
-                results.append(match)
-        
-        # 普通字符串 ""
-        for match in re.findall(r'\"([^\"]*)\"', line):
-            if self._has_chinese(match) and match not in results:
-                results.append(match)
+        # 一次扫描同时处理插值字符串 $"" 和普通字符串 ""
+        for match in _STRING_RE.finditer(line):
+            is_interpolated = match.group('dollar') or match.group('dollar2')
+            text = match.group('text')
+            if self._has_chinese(text):
+                if is_interpolated or text not in results:
+                    results.append(text)
+            elif is_interpolated and self._has_params(text):
+                results.append(text)
         
         return results
     
     def _has_chinese(self, text: str) -> bool:
-        return bool(re.search('[\u4e00-\u9fff]', text))
+        return _CJK_RE.search(text) is not None
     
     def _has_params(self, text: str) -> bool:
-        return bool(re.search(r'\{[^}]+\}', text))
+        return _PARAMX_RE.search(text) is not None
     
     def _format_string(self, text: str) -> str:
         """格式化字符串，参数替换为{0},{1}..."""
-        params = re.findall(r'\{[^}]+\}', text)
-        result = text
-        for i, param in enumerate(params):
-            result = result.replace(param, '{' + str(i) + '}', 1)
-        return result
+        # 一次从左到右替换，按出现顺序编号
+        counter = itertools.count()
+        return _PARAMX_RE.sub(lambda m: '{%d}' % next(counter), text)
     
-    def extract_from_directory(self, dir_path: Path) -> List[ChineseString]:
-        """从目录中提取所有中文字符串"""
+    def extract_from_directory(self, dir_path: Path,
+                               executor: Optional[ProcessPoolExecutor] = None) -> List[ChineseString]:
+        """从目录中提取所有中文字符串，传入executor时复用该进程池"""
         results = []
         
-        for root, dirs, files in os.walk(dir_path):
-            # 过滤忽略的文件夹
-            dirs[:] = [d for d in dirs if d not in self.IGNORE_FOLDERS]
-            
-            for file in files:
-                if Path(file).suffix not in self.CODE_EXTENSIONS:
-                    continue
-                
-                file_path = Path(root) / file
-                strings = self.extract_from_file(file_path)
+        # 先收集所有代码文件
+        file_paths = list(self._iter_code_files(dir_path))
+        
+        # 文件之间互不依赖，多进程并行提取（map保证结果顺序与文件顺序一致）
+        if executor is not None:
+            for strings in executor.map(self.extract_from_file, file_paths, chunksize=32):
                 results.extend(strings)
+        elif len(file_paths) >= PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                for strings in executor.map(self.extract_from_file, file_paths, chunksize=32):
+                    results.extend(strings)
+        else:
+            for file_path in file_paths:
+                results.extend(self.extract_from_file(file_path))
         
         return results
+    
+    def _iter_code_files(self, dir_path) -> Iterator[str]:
+        """递归遍历目录下的代码文件（先当前目录文件，再子目录）"""
+        files = []
+        sub_dirs = []
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # 过滤忽略的文件夹
+                        if entry.name not in self.IGNORE_FOLDERS:
+                            sub_dirs.append(entry.path)
+                    elif os.path.splitext(entry.name)[1] in self.CODE_EXTENSIONS:
+                        files.append(entry.path)
+        except OSError:
+            # 与os.walk一致：无权限或已被删除的目录直接跳过
+            return
+        
+        yield from files
+        for sub_dir in sub_dirs:
+            yield from self._iter_code_files(sub_dir)
 
 
 class CSVGenerator:
     """CSV生成器"""
     
+    __slots__ = ('translator',)
+    
+    # 简单翻译（逐字映射，只有单字的key会生效）
+    WORD_MAP = {
+        '探索': 'EXPLORE', '度': 'DEGREE', '推荐': 'RECOMMEND', '战力': 'POWER',
+        '等级': 'LEVEL', '阵容': 'LINEUP', '为空': 'EMPTY', '无法': 'CANNOT',
+        '跳过': 'SKIP', '主线': 'MAINLINE', '关卡': 'LEVEL', '尚未': 'NOT',
+        '解锁': 'UNLOCK', '路径': 'PATH', '点': 'POINT', '数量': 'COUNT',
+        '错误': 'ERROR', '总': 'TOTAL', '需': 'NEED', '地图': 'MAP',
+        '资产': 'ASSET', '状态': 'STATE', '信息': 'INFO', '显示': 'SHOW',
+        '奖励': 'REWARD', '任务': 'TASK', '完成': 'COMPLETE', '失败': 'FAIL',
+        '成功': 'SUCCESS', '确认': 'CONFIRM', '取消': 'CANCEL', '返回': 'BACK',
+        '关闭': 'CLOSE', '打开': 'OPEN', '设置': 'SETTING', '选项': 'OPTION',
+        '提示': 'TIP', '警告': 'WARNING', '错误': 'ERROR', '可以': 'CAN',
+        '任命': 'APPOINT', '州牧': 'GOVERNOR', '获得': 'GET', '额外': 'EXTRA',
+        '占领': 'OCCUPY', '产出': 'OUTPUT', '加成': 'BONUS',
+        '抽': 'DRAW', '卡': 'CARD', '道': 'ITEM', '具': 'PROP',
+        '足': 'SUFFICIENT', '次': 'TIME', '必': 'MUST', '得': 'GET',
+        '红': 'RED', '将': 'GENERAL', '累': 'TOTAL', '计': 'COUNT',
+        '确': 'CONFIRM', '认': 'CONFIRM', '购': 'PURCHASE', '买': 'BUY',
+        '请': 'PLEASE', '拖': 'DRAG', '拽': 'DROP', '指': 'SPECIFY',
+        '位': 'POSITION', '物': 'ITEM', '品': 'PRODUCT', '数': 'NUMBER',
+        '量': 'AMOUNT', '无': 'NO', '法': 'WAY', '完': 'COMPLETE',
+        '敌': 'ENEMY', '方': 'SIDE', '还': 'STILL', '有': 'HAVE',
+        '单': 'SINGLE', '位': 'UNIT', '战': 'BATTLE', '斗': 'FIGHT',
+        '胜': 'VICTORY', '利': 'PROFIT', '奖': 'REWARD', '励': 'BONUS',
+        '准': 'PREPARE', '备': 'READY', '开': 'START', '始': 'BEGIN',
+        '恭': 'CONGRATULATE', '喜': 'JOY', '获': 'GET',
+    }
+    
+    # 中文 -> "_WORD"，未收录的中文字符保留原字
+    _KEY_TABLE = _build_key_table(WORD_MAP, keep_unknown=True)
+    
     def __init__(self, translator: Optional[DeepSeekTranslator]):
         self.translator = translator
     
@@ -414,96 +650,57 @@ class CSVGenerator:
             print(f"  没有找到中文字符串")
             return
         
-        # 去重
+        # 去重（保留第一次出现的位置）
         unique_data = {}
         for s in strings:
-            if s.value not in unique_data:
-                unique_data[s.value] = s
-        
-        # 生成数据
-        data_rows = []
-        for value, cs in unique_data.items():
-            if self.translator:
-                key = self.translator.translate(value, context)
-            else:
-                key = self._default_key(value, context)
-            
-            # 确保key以模块名开头
-            if context:
-                module_prefix = context.upper() + "_"
-                if not key.startswith(module_prefix):
-                    key = module_prefix + key
-            
-            data_rows.append({
-                'key': key,
-                'value': value,
-                'pos': cs.pos
-            })
-        
-        # 写入CSV
-        with open(output_path, 'w', encoding='utf-8-sig', newline='') as f:
+            unique_data.setdefault(s.value, s)
+        # 原始列表已不再需要，尽早释放
+        strings.clear()
+        
+        # 生成key（API翻译时批量请求）
+        if self.translator:
+            keys = self.translator.translate_batch([(value, context) for value in unique_data])
+        else:
+            keys = [self._default_key(value, context) for value in unique_data]
+        
+        # 逐行写入CSV（64KB缓冲，减少write系统调用）
+        with open(output_path, 'w', encoding='utf-8-sig', newline='', buffering=1 << 16) as f:
             writer = csv.DictWriter(f, fieldnames=['key', 'value', 'pos'])
             writer.writeheader()
-            writer.writerows(data_rows)
+            
+            for (value, cs), key in zip(unique_data.items(), keys):
+                # 确保key以模块名开头
+                if context:
+                    module_prefix = context.upper() + "_"
+                    if not key.startswith(module_prefix):
+                        key = module_prefix + key
+                
+                writer.writerow({
+                    'key': key,
+                    'value': value,
+                    'pos': cs.pos
+                })
         
-        print(f"  ✓ 已生成: {output_path.name} ({len(data_rows)} 条)")
+        print(f"  ✓ 已生成: {output_path.name} ({len(unique_data)} 条)")
     
     def _default_key(self, text: str, context: str) -> str:
         """默认key生成 - 确保以模块名开头"""
         module_name = context.upper() if context else ""
         
-        clean_text = re.sub(r'\{[\d]+\}', '', text).strip()
+        clean_text = _PARAM_RE.sub('', text).strip()
         
         if not clean_text:
             # 只有参数的情况
-            param_count = len(re.findall(r'\{[\d]+\}', text))
+            param_count = len(_PARAM_RE.findall(text))
             return f"{module_name}_PARAM_{param_count}" if module_name else f"PARAM_{param_count}"
         
-        # 简单翻译
-        word_map = {
-            '探索': 'EXPLORE', '度': 'DEGREE', '推荐': 'RECOMMEND', '战力': 'POWER',
-            '等级': 'LEVEL', '阵容': 'LINEUP', '为空': 'EMPTY', '无法': 'CANNOT',
-            '跳过': 'SKIP', '主线': 'MAINLINE', '关卡': 'LEVEL', '尚未': 'NOT',
-            '解锁': 'UNLOCK', '路径': 'PATH', '点': 'POINT', '数量': 'COUNT',
-            '错误': 'ERROR', '总': 'TOTAL', '需': 'NEED', '地图': 'MAP',
-            '资产': 'ASSET', '状态': 'STATE', '信息': 'INFO', '显示': 'SHOW',
-            '奖励': 'REWARD', '任务': 'TASK', '完成': 'COMPLETE', '失败': 'FAIL',
-            '成功': 'SUCCESS', '确认': 'CONFIRM', '取消': 'CANCEL', '返回': 'BACK',
-            '关闭': 'CLOSE', '打开': 'OPEN', '设置': 'SETTING', '选项': 'OPTION',
-            '提示': 'TIP', '警告': 'WARNING', '错误': 'ERROR', '可以': 'CAN',
-            '任命': 'APPOINT', '州牧': 'GOVERNOR', '获得': 'GET', '额外': 'EXTRA',
-            '占领': 'OCCUPY', '产出': 'OUTPUT', '加成': 'BONUS',
-            '抽': 'DRAW', '卡': 'CARD', '道': 'ITEM', '具': 'PROP',
-            '足': 'SUFFICIENT', '次': 'TIME', '必': 'MUST', '得': 'GET',
-            '红': 'RED', '将': 'GENERAL', '累': 'TOTAL', '计': 'COUNT',
-            '确': 'CONFIRM', '认': 'CONFIRM', '购': 'PURCHASE', '买': 'BUY',
-            '请': 'PLEASE', '拖': 'DRAG', '拽': 'DROP', '指': 'SPECIFY',
-            '位': 'POSITION', '物': 'ITEM', '品': 'PRODUCT', '数': 'NUMBER',
-            '量': 'AMOUNT', '无': 'NO', '法': 'WAY', '完': 'COMPLETE',
-            '敌': 'ENEMY', '方': 'SIDE', '还': 'STILL', '有': 'HAVE',
-            '单': 'SINGLE', '位': 'UNIT', '战': 'BATTLE', '斗': 'FIGHT',
-            '胜': 'VICTORY', '利': 'PROFIT', '奖': 'REWARD', '励': 'BONUS',
-            '准': 'PREPARE', '备': 'READY', '开': 'START', '始': 'BEGIN',
-            '恭': 'CONGRATULATE', '喜': 'JOY', '获': 'GET',
-        }
-        
-        words = []
-        for char in clean_text:
-            if '\u4e00' <= char <= '\u9fff':
-                words.append(word_map.get(char, char))
+        result = _keyify(clean_text, self._KEY_TABLE)
         
-        if not words:
+        if not result:
             return f"{module_name}_TEXT" if module_name else "TEXT"
         
         # 确保以模块名开头
-        result = "_".join(words)
-        
-        # 限制长度（减去模块名和下划线的长度）
-        max_len = 50 - len(module_name) - 1
-        if max_len > 0:
-            result = result[:max_len]
-        
-        return f"{module_name}_{result}" if module_name else result
+        return _prefix_key(result, context)
 
 
 def get_api_key() -> Optional[str]:
@@ -574,16 +771,18 @@ def main():
         print(f"\n扫描模式: all")
         print(f"输出目录: {OUTPUT_DIR}\n")
         
-        for item in sorted(code_dir.iterdir()):
-            if item.is_dir() and item.name not in extractor.IGNORE_FOLDERS:
-                print(f"扫描文件夹: {item.name}")
-                strings = extractor.extract_from_directory(item)
-                
-                if strings:
-                    output_path = OUTPUT_DIR / f"{item.name}.csv"
-                    csv_generator.generate(strings, output_path, context=item.name)
-                else:
-                    print(f"  没有找到中文字符串")
+        # 所有子文件夹共用一个进程池，避免每个文件夹都启动一次
+        with ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for item in sorted(code_dir.iterdir()):
+                if item.is_dir() and item.name not in extractor.IGNORE_FOLDERS:
+                    print(f"扫描文件夹: {item.name}")
+                    strings = extractor.extract_from_directory(item, executor)
+                    
+                    if strings:
+                        output_path = OUTPUT_DIR / f"{item.name}.csv"
+                        csv_generator.generate(strings, output_path, context=item.name)
+                    else:
+                        print(f"  没有找到中文字符串")
     
     elif args.mode == 'single':
         if not args.folder:
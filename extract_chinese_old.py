@@ -18,13 +18,54 @@ import os
 import re
 import argparse
 import csv
+import itertools
 import json
-from pathlib import Path
-from typing import List, Dict, Set, Tuple, Optional
+import sqlite3
+import threading
+from collections import OrderedDict, deque
+from typing import List, Dict, Set, Tuple, Optional, Iterator, Iterable
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import sys
 
 
+# 中文字符检测（预编译并绑定search方法）
+_CJK_SEARCH = re.compile('[\u4e00-\u9fff]').search
+# 字节级预筛选：任意非ASCII字节（中文，也包括需要解码报错的GBK/UTF-16等文件），或插值字符串 $"（可能只含参数）
+_NON_ASCII_BYTE_SEARCH = re.compile(rb'[\x80-\xff]|\$"').search
+# 块注释 /* ... */（一次扫描）：先匹配字符串和行注释，使其中的 /* 不会被当成块注释开始
+# 逐字字符串 @"..."（含 $@"、@$"）不处理反斜杠转义，"" 表示引号
+_BLOCK_COMMENT_RE = re.compile(
+    r'(@\$?"(?:[^"]|"")*"|"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\'|//[^\n]*)|/\*.*?\*/', re.S)
+# 字符串字面量（允许未闭合，吃到行尾）或 // 行注释起点
+_COMMENT_RE = re.compile(r'(@\$?"(?:[^"]|"")*"?|"(?:[^"\\]|\\.)*"?|\'(?:[^\'\\]|\\.)*\'?)|//')
+# 参数占位符 {xxx}：{ 后面跟着非 } 字符，直到 }
+_PARAM_RE = re.compile(r'\{[^}]+\}')
+# 插值参数检测：{xxx}，允许一层嵌套的 {}
+_PARAM_SEARCH = re.compile(r'\{(?:[^{}]|\{[^{}]*\})+\}').search
+# Attribute之后紧跟的字段/属性声明代码
+_ATTR_CODE_MATCH = re.compile(r'^\w+\s+\w+.*;?\s*$').match
+
+# 本地翻译用的简单字符映射（未收录的字返回CN）
+_PINYIN_MAP = {
+    '抽': 'DRAW', '卡': 'CARD', '道': 'ITEM', '具': 'PROP', '不': 'NOT',
+    '足': 'SUFFICIENT', '再': 'RE', '结': 'BIND', '义': 'YI', '次': 'TIME',
+    '必': 'MUST', '得': 'GET', '红': 'RED', '将': 'GENERAL', '累': 'CUMULATIVE',
+    '计': 'COUNT', '总': 'TOTAL', '资': 'RESOURCE', '源': 'SOURCE', '提': 'EXTRACT',
+    '示': 'SHOW', '确': 'CONFIRM', '认': 'CONFIRM', '取': 'GET', '消': 'CANCEL',
+    '完': 'COMPLETE', '错': 'ERROR', '误': 'ERROR', '失': 'FAIL',
+    '败': 'FAIL', '成': 'SUCCESS', '功': 'SUCCESS', '请': 'PLEASE', '求': 'REQUEST',
+    '加': 'ADD', '载': 'LOAD', '时': 'TIME', '间': 'TIME', '限': 'LIMIT',
+    '拖': 'DRAG', '拽': 'DROP', '物': 'ITEM', '品': 'PRODUCT', '数': 'COUNT',
+    '量': 'AMOUNT', '无': 'NO', '法': 'WAY', '操': 'OPERATE', '作': 'ACTION',
+    '定': 'DEFINE', '购': 'PURCHASE', '买': 'BUY', '这': 'THIS',
+    '个': 'GE', '吗': 'QUESTION', '恭': 'CONGRATULATE', '喜': 'JOY', '获': 'GET',
+    '奖': 'REWARD', '励': 'INCENTIVE', '方': 'DIRECTION', '单': 'SINGLE', '位': 'UNIT',
+    '敌': 'ENEMY', '还': 'STILL', '有': 'HAVE', '胜': 'VICTORY', '利': 'PROFIT',
+    '准': 'PREPARE', '备': 'PREPARE', '开': 'START', '始': 'BEGIN',
+}
+
+
 @dataclass
 class ChineseString:
     """中文字符串信息"""
@@ -36,38 +77,88 @@ class ChineseString:
 
 
 class TranslationCache:
-    """翻译缓存，用于减少API调用"""
-    def __init__(self, cache_file: str = "translation_cache.json"):
+    """
+    翻译缓存，用于减少API调用
+    使用SQLite（WAL模式）存储：按需查询、即时写入，中途退出也不会丢失已翻译的结果
+    内存中只保留最近使用的max_size条（LRU），其余按需从数据库读取
+    """
+    def __init__(self, cache_file: str = "translation_cache.db",
+                 legacy_json_file: str = "translation_cache.json",
+                 max_size: int = 4096):
         self.cache_file = cache_file
-        self.cache: Dict[str, str] = self._load_cache()
-    
-    def _load_cache(self) -> Dict[str, str]:
-        if os.path.exists(self.cache_file):
-            try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
+        self.max_size = max_size
+        # 内存前置缓存，按最近使用排序
+        self.cache: "OrderedDict[str, str]" = OrderedDict()
+        # 翻译器会在多个线程中访问缓存，共用连接需要加锁
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(cache_file, isolation_level=None, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS t(k TEXT PRIMARY KEY, v TEXT)')
+        self._import_legacy_json(legacy_json_file)
+    
+    def _import_legacy_json(self, json_file: str):
+        """首次使用时导入旧版JSON缓存"""
+        if not os.path.exists(json_file):
+            return
+        if self.conn.execute('SELECT 1 FROM t LIMIT 1').fetchone():
+            return
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except:
+            return
+        with self.conn:
+            self.conn.execute('BEGIN')
+            self.conn.executemany('INSERT OR REPLACE INTO t(k, v) VALUES (?, ?)', data.items())
     
     def save(self):
-        with open(self.cache_file, 'w', encoding='utf-8') as f:
-            json.dump(self.cache, f, ensure_ascii=False, indent=2)
+        """每次set已即时写入数据库；结束时关闭连接，把WAL合并回主数据库文件"""
+        with self._lock:
+            self.conn.close()
     
     def get(self, key: str) -> Optional[str]:
-        return self.cache.get(key)
+        with self._lock:
+            value = self.cache.get(key)
+            if value is not None:
+                self.cache.move_to_end(key)
+                return value
+            
+            row = self.conn.execute('SELECT v FROM t WHERE k=?', (key,)).fetchone()
+            if row is None:
+                return None
+            self._remember(key, row[0])
+            return row[0]
     
     def set(self, key: str, value: str):
+        with self._lock:
+            self._remember(key, value)
+            self.conn.execute('INSERT OR REPLACE INTO t(k, v) VALUES (?, ?)', (key, value))
+    
+    def _remember(self, key: str, value: str):
+        """写入内存缓存，超出max_size时淘汰最久未使用的条目（调用方需持有锁）"""
         self.cache[key] = value
+        self.cache.move_to_end(key)
+        if len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)
 
 
 class DeepSeekTranslator:
     """DeepSeek API翻译器"""
     
+    # 批量翻译时的并发请求数
+    MAX_WORKERS = 16
+    
     def __init__(self, api_key: str, cache: TranslationCache):
+        import requests
+        from requests.adapters import HTTPAdapter
+        
         self.api_key = api_key
         self.cache = cache
         self.api_url = "https://api.deepseek.com/v1/chat/completions"
+        # 复用同一个Session，请求之间共享TCP/TLS连接
+        # 连接池大小与并发数一致（默认只有10个），否则多出的连接用完即被丢弃
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=self.MAX_WORKERS))
     
     def translate(self, chinese_text: str, context: str = "") -> str:
         """
@@ -96,6 +187,28 @@ class DeepSeekTranslator:
         self.cache.set(cache_key, result)
         return result
     
+    def translate_many(self, items: List[Tuple[str, str]]) -> List[str]:
+        """
+        批量翻译 [(中文文本, 上下文), ...]，返回顺序与输入一致
+        命中缓存的直接返回，其余并发请求API
+        """
+        results: List[Optional[str]] = []
+        pending = []
+        for i, (chinese_text, context) in enumerate(items):
+            cache_key = f"{context}:{chinese_text}" if context else chinese_text
+            cached = self.cache.get(cache_key)
+            results.append(cached)
+            if not cached:
+                pending.append(i)
+        
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                translated = executor.map(lambda i: self.translate(*items[i]), pending)
+                for i, result in zip(pending, translated):
+                    results[i] = result
+        
+        return results
+    
     def _build_prompt(self, chinese_text: str, context: str = "") -> str:
         return f"""请将以下中文文本翻译成C#常量命名风格（使用下划线分隔大写字母，格式如：DRAW_DRAW_ITEM_INSUFFICIENT）
 
@@ -117,8 +230,6 @@ class DeepSeekTranslator:
     
     def _call_api(self, prompt: str) -> Optional[str]:
         """调用DeepSeek API"""
-        import requests
-        
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
@@ -134,7 +245,7 @@ class DeepSeekTranslator:
         }
         
         try:
-            response = requests.post(self.api_url, headers=headers, json=data, timeout=30)
+            response = self.session.post(self.api_url, headers=headers, json=data, timeout=30)
             response.raise_for_status()
             result = response.json()
             if result.get("choices"):
@@ -157,44 +268,35 @@ class DeepSeekTranslator:
             return "UNKNOWN"
         
         # 使用简单的翻译
-        result = "_".join([self._char_to_pinyin(c) for c in words[:5]])
+        get = _PINYIN_MAP.get
+        result = "_".join([get(c, 'CN') for c in words[:5]])
         return result.upper()[:50]
     
     def _char_to_pinyin(self, char: str) -> str:
         """简单的中文字符转拼音"""
-        pinyin_map = {
-            '抽': 'DRAW', '卡': 'CARD', '道': 'ITEM', '具': 'PROP', '不': 'NOT',
-            '足': 'SUFFICIENT', '再': 'RE', '结': 'BIND', '义': 'YI', '次': 'TIME',
-            '必': 'MUST', '得': 'GET', '红': 'RED', '将': 'GENERAL', '累': 'CUMULATIVE',
-            '计': 'COUNT', '总': 'TOTAL', '资': 'RESOURCE', '源': 'SOURCE', '提': 'EXTRACT',
-            '示': 'SHOW', '确': 'CONFIRM', '认': 'CONFIRM', '取': 'GET', '消': 'CANCEL',
-            '完': 'COMPLETE', '成': 'COMPLETE', '错': 'ERROR', '误': 'ERROR', '失': 'FAIL',
-            '败': 'FAIL', '成': 'SUCCESS', '功': 'SUCCESS', '请': 'PLEASE', '求': 'REQUEST',
-            '加': 'ADD', '载': 'LOAD', '时': 'TIME', '间': 'TIME', '限': 'LIMIT',
-            '拖': 'DRAG', '拽': 'DROP', '物': 'ITEM', '品': 'PRODUCT', '数': 'COUNT',
-            '量': 'AMOUNT', '无': 'NO', '法': 'WAY', '操': 'OPERATE', '作': 'ACTION',
-            '确': 'CONFIRM', '定': 'DEFINE', '购': 'PURCHASE', '买': 'BUY', '这': 'THIS',
-            '个': 'GE', '吗': 'QUESTION', '恭': 'CONGRATULATE', '喜': 'JOY', '获': 'GET',
-            '奖': 'REWARD', '励': 'INCENTIVE', '方': 'DIRECTION', '单': 'SINGLE', '位': 'UNIT',
-            '敌': 'ENEMY', '还': 'STILL', '有': 'HAVE', '胜': 'VICTORY', '利': 'PROFIT',
-            '准': 'PREPARE', '备': 'PREPARE', '开': 'START', '始': 'BEGIN', '始': 'BEGIN',
-        }
-        return pinyin_map.get(char, 'CN')
+        return _PINYIN_MAP.get(char, 'CN')
+
+
+def _blank_block_comment(match: re.Match) -> str:
+    """块注释替换为等量换行（保持行号不变），其余匹配原样返回"""
+    if match.group(1) is not None:
+        return match.group(1)
+    return '\n' * match.group().count('\n')
 
 
 class ChineseExtractor:
     """中文字符串提取器"""
     
-    # 需要忽略的文件夹模式
-    IGNORE_FOLDER_PATTERNS = [
-        re.compile(r'.*Bind.*', re.IGNORECASE),  # 包含Bind的文件夹
-        re.compile(r'.*\.git.*'),
-        re.compile(r'.*\.svn.*'),
-        re.compile(r'.*node_modules.*'),
-        re.compile(r'.*__pycache__.*'),
-        re.compile(r'.*\.vscode.*'),
-        re.compile(r'.*\.idea.*'),
-    ]
+    # 需要忽略的文件夹：路径中任一部分（转小写后）包含以下子串即跳过
+    IGNORE_SUBSTRINGS = (
+        'bind',  # 包含Bind的文件夹
+        '.git',
+        '.svn',
+        'node_modules',
+        '__pycache__',
+        '.vscode',
+        '.idea',
+    )
     
     # 需要忽略的API模式
     IGNORE_API_PATTERNS = [
@@ -215,68 +317,95 @@ class ChineseExtractor:
         re.compile(r'ExceptionHelper\.'),
     ]
     
+    # 所有忽略的API合并成一个正则，整行搜索一次（出现在字符串里也算，如"请查看Debug.Log输出"）
+    IGNORE_API_RE = re.compile('|'.join(p.pattern for p in IGNORE_API_PATTERNS))
+    
+    # 单次扫描的词法正则：插值字符串 $"..."、普通字符串 "..."（支持转义）
+    # 逐字字符串 @"..."、$@"..."、@$"..." 不处理反斜杠转义，"" 表示引号
+    TOKEN_RE = re.compile(
+        r'(?:\$@|@\$)"(?P<vinterp>(?:[^"]|"")*)"'
+        r'|@"(?P<vstr>(?:[^"]|"")*)"'
+        r'|\$"(?P<interp>(?:[^"\\]|\\.)*)"'
+        r'|"(?P<str>(?:[^"\\]|\\.)*)"'
+    )
+    
     # 代码文件扩展名
     # CODE_EXTENSIONS = {'.cs', '.ts', '.js', '.jsx', '.vue', '.py', '.java', '.cpp', '.c', '.h'}
     CODE_EXTENSIONS = {'.cs',}
     
+    # 每次交给解析进程的文件数
+    FILE_CHUNK_SIZE = 32
+    # 最多同时在途的文件批数：遍历目录和解析重叠进行，又不会无限堆积
+    MAX_PENDING_CHUNKS = 64
+    
     def __init__(self, translator: Optional[DeepSeekTranslator] = None):
         self.translator = translator
     
     def should_skip_file(self, file_path: str) -> bool:
         """检查是否应该跳过该文件"""
-        # 检查文件夹模式
-        path_parts = file_path.split(os.sep)
-        for part in path_parts:
-            for pattern in self.IGNORE_FOLDER_PATTERNS:
-                if pattern.match(part):
-                    return True
-        return False
+        # 检查文件夹模式（子串匹配，比逐个正则匹配快）
+        return any(self._is_ignored_name(part) for part in file_path.split(os.sep))
+    
+    def _is_ignored_name(self, name: str) -> bool:
+        """单个文件/文件夹名是否包含需要忽略的子串"""
+        name = name.lower()
+        return any(sub in name for sub in self.IGNORE_SUBSTRINGS)
     
     def extract_from_file(self, file_path: str) -> List[ChineseString]:
         """从单个文件中提取中文字符串"""
         results = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with open(file_path, 'rb') as f:
+                raw = f.read()
         except Exception as e:
             print(f"读取文件失败 {file_path}: {e}")
             return results
         
-        lines = content.split('\n')
-        
-        # 预处理：标记注释区域
-        in_multiline_comment = False
-        in_header_attribute = False
+        # 大部分文件是纯ASCII（不含中文），直接跳过，省去解码和逐行扫描
+        if not _NON_ASCII_BYTE_SEARCH(raw):
+            return results
         
-        for i, line in enumerate(lines, 1):
-            original_line = line
+        # 整体解码一次：非UTF-8文件（如GBK）报错并整个跳过
+        try:
+            content = raw.decode('utf-8')
+        except UnicodeDecodeError as e:
+            print(f"读取文件失败 {file_path}: {e}")
+            return results
+        del raw
+        
+        # 热循环中用到的方法和值提前绑定到局部变量
+        remove_comment = self._remove_comment_from_line
+        is_attribute = self._is_attribute_declaration
+        find_chinese = self._find_chinese_strings
+        format_string = self._format_string
+        append = results.append
+        file_name = os.path.basename(file_path)
+        
+        # 预处理：去掉块注释（只有出现 /* 的文件才需要扫描）
+        if '/*' in content:
+            content = _BLOCK_COMMENT_RE.sub(_blank_block_comment, content)
+        
+        for i, line in enumerate(content.split('\n'), 1):
+            # 既无中文也无插值字符串的行不可能有结果，跳过
+            if '$"' not in line and not _CJK_SEARCH(line):
+                continue
             
             # 移除行尾注释（但保留字符串）
-            line_without_comment = self._remove_comment_from_line(line)
-            
-            # 检查多行注释
-            if '/*' in line:
-                in_multiline_comment = True
-            if '*/' in line:
-                in_multiline_comment = False
-            
-            # 跳过注释区域
-            if in_multiline_comment:
-                continue
+            line_without_comment = remove_comment(line)
             
             # 检查并跳过Attribute声明（如[Header("...")]、[Tooltip("...")]等）
-            if self._is_attribute_declaration(line):
+            if is_attribute(line):
                 continue
             
-            # 在原始行中查找中文字符串
-            chinese_strings = self._find_chinese_strings(original_line)
+            # 在去掉注释的行中查找中文字符串（注释中的中文不提取）
+            chinese_strings = find_chinese(line_without_comment)
             
             for chinese_text in chinese_strings:
-                formatted = self._format_string(chinese_text)
-                pos = f"{os.path.basename(file_path)}---{i}"
+                formatted = format_string(chinese_text)
+                pos = f"{file_name}---{i}"
                 
-                results.append(ChineseString(
+                append(ChineseString(
                     value=formatted,
                     original_value=chinese_text,
                     pos=pos,
@@ -288,35 +417,14 @@ class ChineseExtractor:
     
     def _remove_comment_from_line(self, line: str) -> str:
         """移除行尾注释，保留字符串"""
-        # 找到字符串开始的位置（不是转义的引号）
-        result = []
-        in_string = False
-        string_char = None
-        
-        for char in line:
-            if not in_string and (char == '"' or char == "'"):
-                in_string = True
-                string_char = char
-                result.append(char)
-            elif in_string and char == string_char:
-                # 检查是否是转义的引号
-                if result and result[-1] == '\\':
-                    result[-1] = char
-                else:
-                    in_string = False
-                    string_char = None
-                    result.append(char)
-            elif not in_string and char == '/':
-                # 检查是否是注释开始
-                if result and result[-1] == '/':
-                    result.pop()  # 移除第一个/
-                    break  # 后面都是注释
-                else:
-                    result.append(char)
-            else:
-                result.append(char)
+        if '/' not in line:
+            return line
         
-        return ''.join(result)
+        # 依次匹配字符串和 //，第一个不在字符串里的 // 之后都是注释
+        for m in _COMMENT_RE.finditer(line):
+            if m.group(1) is None:
+                return line[:m.start()]
+        return line
     
     def _is_attribute_declaration(self, line: str) -> bool:
         """
@@ -324,6 +432,10 @@ class ChineseExtractor:
         例如：[Header("...")]、[Tooltip("...")]、[Description("...")] 等
         规则：忽略所有Attribute声明中的中文
         """
+        # 绝大多数行不含 [，直接返回，不做任何字符串分配
+        if '[' not in line:
+            return False
+        
         stripped = line.strip()
         
         # 检查是否以 [ 开头且包含 ]
@@ -339,7 +451,7 @@ class ChineseExtractor:
             
             # 检查是否是字段/属性声明开头的行
             # 例如：public int count; [Tooltip("xxx")] 这种情况不应该跳过
-            if re.match(r'^\w+\s+\w+.*;?\s*$', after_bracket):
+            if _ATTR_CODE_MATCH(after_bracket):
                 return False
             
             # 其他情况视为纯Attribute声明
@@ -354,38 +466,35 @@ class ChineseExtractor:
         只要字符串内容不为空，就会被记录
         """
         results = []
-        
-        # 忽略Debug相关API
-        for pattern in self.IGNORE_API_PATTERNS:
-            if pattern.search(line):
-                return []
-        
-        # 处理插值字符串 $"..." 
-        # 注意：先处理插值字符串，再处理普通字符串
-        interpolated_matches = re.findall(r'\$\"([^\"]*)\"', line)
-        for match in interpolated_matches:
-            # 插值字符串：如果包含中文，或者包含参数占位符，都应该记录
-            if self._contains_chinese(match) or self._has_parameters(match):
-                results.append(match)
-        
-        # 处理普通字符串 "..."
-        string_matches = re.findall(r'\"([^\"]*)\"', line)
-        for match in string_matches:
-            if self._contains_chinese(match):
-                # 避免重复添加已经在插值字符串中找到的内容
-                if match not in results:
+        # 已收集的内容，用集合判断重复（results只负责保持顺序）
+        seen = set()
+        
+        # 忽略Debug相关API：整行跳过
+        if self.IGNORE_API_RE.search(line):
+            return []
+        
+        # 一次扫描收集字符串
+        # 中文检测：纯ASCII（绝大多数代码字符串）由C层的isascii直接排除，不进正则
+        for token in self.TOKEN_RE.finditer(line):
+            # 每次只有一个命名分组参与匹配
+            kind = token.lastgroup
+            match = token.group(kind)
+            if kind == 'interp' or kind == 'vinterp':
+                # 插值字符串：如果包含中文，或者包含参数占位符，都应该记录
+                if (not match.isascii() and _CJK_SEARCH(match)) or _PARAM_SEARCH(match):
                     results.append(match)
+                    seen.add(match)
+                continue
+            
+            # 普通字符串
+            if not match.isascii() and _CJK_SEARCH(match):
+                # 避免重复添加已经找到的内容
+                if match not in seen:
+                    results.append(match)
+                    seen.add(match)
         
         return results
     
-    def _has_parameters(self, text: str) -> bool:
-        """检查是否包含参数占位符 {xxx}"""
-        return bool(re.search(r'\{(?:[^{}]|\{[^{}]*\})+\}', text))
-    
-    def _contains_chinese(self, text: str) -> bool:
-        """检查是否包含中文字符"""
-        return bool(re.search('[\u4e00-\u9fff]', text))
-    
     def _format_string(self, text: str) -> str:
         """格式化字符串，将参数替换为 {0}, {1} 等
         
@@ -395,56 +504,102 @@ class ChineseExtractor:
         - 方法调用: {NumberUtils.FormatNumber(fake_power)} -> {0}
         - 长度属性: {monster_id.Length} -> {0}
         """
-        # 找到所有 {xxx} 或 {...} 形式的参数占位符
-        # 使用 \{[^}]+\} 匹配 { 后面跟着非 } 字符，直到 }
-        param_pattern = r'\{[^}]+\}'
-        
-        # 找到所有参数占位符
-        params = re.findall(param_pattern, text)
-        
-        if not params:
-            return text
-        
-        # 替换为 {0}, {1}, {2}...
-        result = text
-        for i, param in enumerate(params):
-            # 只替换第一个匹配，确保按顺序
-            result = result.replace(param, '{' + str(i) + '}', 1)
-        
-        return result
+        # 一次扫描，按出现顺序替换为 {0}, {1}, {2}...
+        counter = itertools.count()
+        return _PARAM_RE.sub(lambda m: '{%d}' % next(counter), text)
     
     def extract_from_directory(self, dir_path: str) -> Dict[str, List[ChineseString]]:
         """从目录中提取所有中文字符串"""
-        results = {}
+        return self.extract_from_directories([dir_path])[0]
+    
+    def extract_from_directories(self, dir_paths: List[str]) -> List[Dict[str, List[ChineseString]]]:
+        """
+        从多个目录中提取中文字符串，返回与dir_paths一一对应的结果
+        所有目录的文件共用一个进程池，目录之间也并行解析
+        """
+        all_results: List[Dict[str, List[ChineseString]]] = [{} for _ in dir_paths]
+        tasks = self._iter_tasks(dir_paths)
+        
+        # 多进程并行解析（正则解析是CPU密集型）
+        # 边遍历目录边提交，按提交顺序收集结果，保证结果顺序与文件顺序一致
+        pending = deque()
+        with ProcessPoolExecutor() as pool:
+            while True:
+                chunk = list(itertools.islice(tasks, self.FILE_CHUNK_SIZE))
+                if not chunk:
+                    break
+                future = pool.submit(extract_from_files_worker, [path for _, path in chunk])
+                pending.append((chunk, future))
+                
+                # 在途批数达到上限时，先收集最早的一批
+                if len(pending) >= self.MAX_PENDING_CHUNKS:
+                    chunk, future = pending.popleft()
+                    self._group_results(dir_paths, all_results, chunk, future.result())
+            
+            while pending:
+                chunk, future = pending.popleft()
+                self._group_results(dir_paths, all_results, chunk, future.result())
         
-        for root, dirs, files in os.walk(dir_path):
-            # 过滤掉需要忽略的文件夹
-            dirs[:] = [d for d in dirs if not self.should_skip_file(os.path.join(root, d))]
+        return all_results
+    
+    def _iter_tasks(self, dir_paths: List[str]) -> Iterator[Tuple[int, str]]:
+        """依次产出 (目录下标, 文件路径)"""
+        for index, dir_path in enumerate(dir_paths):
+            # 目录本身路径已命中忽略规则时，其下所有文件都要跳过
+            if self.should_skip_file(dir_path):
+                continue
             
-            for file in files:
-                if Path(file).suffix not in self.CODE_EXTENSIONS:
-                    continue
+            # 忽略规则在遍历时按名字过滤，不再逐个文件检查完整路径
+            for file_path in self._iter_code_files(dir_path):
+                yield index, file_path
+    
+    def _group_results(self, dir_paths: List[str], all_results: List[Dict[str, List[ChineseString]]],
+                       chunk: List[Tuple[int, str]], chunk_strings: List[List[ChineseString]]):
+        """把一批文件的提取结果按文件夹分组，合并到all_results中"""
+        for (index, file_path), strings in zip(chunk, chunk_strings):
+            if strings:
+                # 按文件夹分组
+                dir_path = dir_paths[index]
+                relative_path = os.path.relpath(file_path, dir_path)
+                folder = os.path.dirname(relative_path)
+                if folder == '.':
+                    folder = os.path.basename(dir_path)
                 
-                file_path = os.path.join(root, file)
+                results = all_results[index]
+                if folder not in results:
+                    results[folder] = []
                 
-                if self.should_skip_file(file_path):
-                    continue
-                
-                strings = self.extract_from_file(file_path)
-                
-                if strings:
-                    # 按文件夹分组
-                    relative_path = os.path.relpath(file_path, dir_path)
-                    folder = os.path.dirname(relative_path)
-                    if folder == '.':
-                        folder = os.path.basename(dir_path)
-                    
-                    if folder not in results:
-                        results[folder] = []
-                    
-                    results[folder].extend(strings)
-        
-        return results
+                results[folder].extend(strings)
+    
+    def _iter_code_files(self, dir_path: str) -> Iterator[str]:
+        """
+        用os.scandir递归遍历代码文件（先当前目录文件，再子目录，与os.walk顺序一致）
+        名字命中忽略规则的文件夹不会进入，文件也不会返回
+        """
+        files = []
+        sub_dirs = []
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if self._is_ignored_name(entry.name):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        sub_dirs.append(entry.path)
+                    elif os.path.splitext(entry.name)[1] in self.CODE_EXTENSIONS:
+                        files.append(entry.path)
+        except OSError:
+            # 与os.walk一致：无权限或已被删除的目录直接跳过
+            return
+        
+        yield from files
+        for sub_dir in sub_dirs:
+            yield from self._iter_code_files(sub_dir)
+
+
+def extract_from_files_worker(file_paths: List[str]) -> List[List[ChineseString]]:
+    """进程池工作函数：模块级且无状态，可以被pickle；一次处理一批文件，减少进程间通信"""
+    extractor = ChineseExtractor()
+    return [extractor.extract_from_file(file_path) for file_path in file_paths]
 
 
 class CSVGenerator:
@@ -481,32 +636,51 @@ class CSVGenerator:
         
         return "_".join(words).upper()
     
-    def generate_csv(self, strings: List[ChineseString], output_path: str, context: str = ""):
-        """生成CSV文件"""
-        # 去重（基于格式化后的value）
-        unique_data = {}
+    def build_key_map(self, groups: Iterable[Tuple[str, Iterable[ChineseString]]]) -> Dict[str, str]:
+        """
+        跨多个 (上下文, 字符串列表) 全局去重后一次性生成key，返回 value -> key
+        同一文本只翻译一次，上下文取第一次出现时的文件夹
+        """
+        contexts: Dict[str, str] = {}
+        for context, strings in groups:
+            for s in strings:
+                if s.value not in contexts:
+                    contexts[s.value] = context
+        
+        if self.translator:
+            keys = self.translator.translate_many(list(contexts.items()))
+        else:
+            keys = [self._default_key_translate(value) for value in contexts]
+        
+        return dict(zip(contexts, keys))
+    
+    def generate_csv(self, strings: Iterable[ChineseString], output_path: str, context: str = "",
+                     key_map: Optional[Dict[str, str]] = None):
+        """
+        生成CSV文件（strings可以是任意可迭代对象，只遍历一次）
+        传入key_map（见build_key_map）时直接使用其中的key，不再单独翻译
+        """
+        # 去重（基于格式化后的value），只保留第一次出现的位置
+        unique_pos: Dict[str, str] = {}
         for s in strings:
-            key = s.value
-            if key not in unique_data:
-                unique_data[key] = s
-        
-        # 生成数据
-        data_rows = []
-        for value, cs in unique_data.items():
-            key = self.generate_key(value, context)
-            data_rows.append({
-                'key': key,
-                'value': value,
-                'pos': cs.pos
-            })
-        
-        # 写入CSV
-        with open(output_path, 'w', encoding='utf-8-sig', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=['key', 'value', 'pos'])
-            writer.writeheader()
-            writer.writerows(data_rows)
-        
-        print(f"已生成: {output_path} (共 {len(data_rows)} 条)")
+            if s.value not in unique_pos:
+                unique_pos[s.value] = s.pos
+        
+        # 生成key（使用API时一次性并发翻译所有字符串）
+        if key_map is not None:
+            keys = [key_map[value] for value in unique_pos]
+        elif self.translator:
+            keys = self.translator.translate_many([(value, context) for value in unique_pos])
+        else:
+            keys = [self._default_key_translate(value) for value in unique_pos]
+        
+        # 写入CSV：行直接流式交给csv.writer，不再构造中间的行列表
+        with open(output_path, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(['key', 'value', 'pos'])
+            writer.writerows(zip(keys, unique_pos, unique_pos.values()))
+        
+        print(f"已生成: {output_path} (共 {len(unique_pos)} 条)")
 
 
 def main():
@@ -558,8 +732,11 @@ def main():
     
     # 如果有API密钥，初始化翻译器
     if api_key:
-        translator = DeepSeekTranslator(api_key, cache)
-        print("✓ DeepSeek翻译功能已启用")
+        try:
+            translator = DeepSeekTranslator(api_key, cache)
+            print("✓ DeepSeek翻译功能已启用")
+        except ImportError as e:
+            print(f"⚠ 无法导入requests（{e}），将不使用DeepSeek翻译")
     
     extractor = ChineseExtractor(translator)
     csv_generator = CSVGenerator(translator)
@@ -570,6 +747,7 @@ def main():
         output_base = args.output_dir or dir_path
         
         # 遍历输入路径下的所有子文件夹
+        items = []
         for item in os.listdir(dir_path):
             item_path = os.path.join(dir_path, item)
             if os.path.isdir(item_path):
@@ -577,26 +755,37 @@ def main():
                 if extractor.should_skip_file(item_path):
                     continue
                 
-                print(f"\n扫描文件夹: {item}")
-                results = extractor.extract_from_directory(item_path)
-                
-                if results:
-                    # 生成CSV文件名（使用子文件夹名称）
-                    csv_name = item
-                    
-                    # 确保是有效的文件名
-                    csv_name = re.sub(r'[<>:"/\\|?*]', '_', csv_name)
-                    output_path = os.path.join(output_base, f"{csv_name}.csv")
-                    
-                    # 合并所有字符串
-                    all_strings = []
-                    for folder, strings in results.items():
-                        all_strings.extend(strings)
-                    
-                    # 生成CSV
-                    csv_generator.generate_csv(all_strings, output_path, context=item)
-                else:
-                    print(f"  文件夹 {item} 中没有找到中文字符串")
+                print(f"扫描文件夹: {item}")
+                items.append(item)
+        
+        # 所有子文件夹一起提取（共用一个进程池并行解析），再统一翻译
+        all_results = extractor.extract_from_directories([os.path.join(dir_path, item) for item in items])
+        
+        folder_results = []
+        for item, results in zip(items, all_results):
+            if results:
+                folder_results.append((item, results))
+            else:
+                print(f"  文件夹 {item} 中没有找到中文字符串")
+        print()
+        
+        # 全局去重：多个文件夹中重复出现的文本（如"确定"、"取消"）只翻译一次
+        key_map = csv_generator.build_key_map(
+            (item, itertools.chain.from_iterable(results.values()))
+            for item, results in folder_results
+        )
+        
+        for item, results in folder_results:
+            # 生成CSV文件名（使用子文件夹名称）
+            csv_name = item
+            
+            # 确保是有效的文件名
+            csv_name = re.sub(r'[<>:"/\\|?*]', '_', csv_name)
+            output_path = os.path.join(output_base, f"{csv_name}.csv")
+            
+            # 生成CSV（各文件夹的结果直接串联，不再合并成新列表）
+            all_strings = itertools.chain.from_iterable(results.values())
+            csv_generator.generate_csv(all_strings, output_path, context=item, key_map=key_map)
     
     elif args.mode == 'single':
         # 只扫描单个目录
@@ -615,11 +804,7 @@ def main():
             csv_name = re.sub(r'[<>:"/\\|?*]', '_', csv_name)
             output_path = os.path.join(output_base, f"{csv_name}.csv")
             
-            # 合并所有字符串
-            all_strings = []
-            for folder, strings in results.items():
-                all_strings.extend(strings)
-            
+            all_strings = itertools.chain.from_iterable(results.values())
             csv_generator.generate_csv(all_strings, output_path, context=folder_name)
     
     # 保存翻译缓存
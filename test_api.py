@@ -14,6 +14,22 @@ import sys
 import json
 
 
+# 提示词模板，每个测试只需填入中文和上下文
+PROMPT_TMPL = """将以下中文翻译成C#常量命名风格（全部大写，下划线分隔，只返回翻译结果）：
+
+中文: {cn}
+上下文: {ctx}
+
+示例：抽卡道具不足 -> DRAW_CARD_ITEM_INSUFFICIENT"""
+
+# 请求体中与测试用例无关的固定部分
+STATIC_DATA = {
+    "model": "deepseek-chat",
+    "max_tokens": 50,
+    "temperature": 0.3
+}
+
+
 def test_deepseek_api(api_key: str):
     """测试DeepSeek API"""
     print("=" * 60)
@@ -30,11 +46,12 @@ def test_deepseek_api(api_key: str):
     print(f"API密钥: {api_key[:10]}...{api_key[-4:]}")
     print()
     
-    # 导入urllib（Python内置，无需安装）
-    import urllib.request
-    import urllib.error
+    # 导入http.client（Python内置，无需安装）
+    import http.client
     
-    url = "https://api.deepseek.com/v1/chat/completions"
+    # 所有测试复用同一个连接（HTTP/1.1 keep-alive），只做一次TLS握手
+    conn = http.client.HTTPSConnection("api.deepseek.com", timeout=30)
+    path = "/v1/chat/completions"
     
     # 测试数据
     test_cases = [
@@ -56,29 +73,24 @@ def test_deepseek_api(api_key: str):
     for chinese_text, context, description in test_cases:
         print(f"测试 [{description}]: {chinese_text}")
         
-        prompt = f"""将以下中文翻译成C#常量命名风格（全部大写，下划线分隔，只返回翻译结果）：
-
-中文: {chinese_text}
-上下文: {context}
-
-示例：抽卡道具不足 -> DRAW_CARD_ITEM_INSUFFICIENT"""
-
-        data = {
-            "model": "deepseek-chat",
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": 50,
-            "temperature": 0.3
-        }
+        prompt = PROMPT_TMPL.format(cn=chinese_text, ctx=context)
+        data = {**STATIC_DATA, "messages": [{"role": "user", "content": prompt}]}
         
         try:
-            req = urllib.request.Request(
-                url,
-                data=json.dumps(data).encode('utf-8'),
-                headers=headers
-            )
+            conn.request("POST", path, body=json.dumps(data).encode('utf-8'), headers=headers)
+            response = conn.getresponse()
+            # 无论成功与否都要读完响应体，连接才能继续复用
+            body = response.read()
             
-            with urllib.request.urlopen(req, timeout=30) as response:
-                result = json.loads(response.read().decode('utf-8'))
+            if response.status != 200:
+                print(f"  HTTP错误: {response.status}")
+                if response.status == 401:
+                    print("     原因: API密钥无效")
+                elif response.status == 429:
+                    print("     原因: 请求频率超限")
+                fail_count += 1
+            else:
+                result = json.loads(body.decode('utf-8'))
                 
                 if result.get("choices"):
                     translation = result["choices"][0]["message"]["content"].strip()
@@ -88,15 +100,10 @@ def test_deepseek_api(api_key: str):
                     print(f"  API返回格式错误")
                     fail_count += 1
                     
-        except urllib.error.HTTPError as e:
-            print(f"  HTTP错误: {e.code}")
-            if e.code == 401:
-                print("     原因: API密钥无效")
-            elif e.code == 429:
-                print("     原因: 请求频率超限")
-            fail_count += 1
-        except urllib.error.URLError as e:
-            print(f"  网络错误: {e.reason}")
+        except (OSError, http.client.HTTPException) as e:
+            print(f"  网络错误: {e}")
+            # 关闭后下一次请求会自动重新建立连接
+            conn.close()
             fail_count += 1
         except Exception as e:
             print(f"  未知错误: {e}")
@@ -104,6 +111,8 @@ def test_deepseek_api(api_key: str):
         
         print()
     
+    conn.close()
+    
     # 总结
     print("=" * 60)
     print(f"测试结果: {success_count} 成功, {fail_count} 失败")